@@ -1,13 +1,16 @@
 """The NAD AVR integration."""
 
+from datetime import timedelta
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT, Platform
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN
-from .nad_client import NADClient
+from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .coordinator import STORAGE_VERSION, NADCoordinator
+from .nad_client import NADClient, NADConnectionPool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,19 +22,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     host = entry.data[CONF_HOST]
     port = entry.data[CONF_PORT]
 
-    # Create client
+    # Create client and the coordinator that polls through it
     client = NADClient(host, port)
+    coordinator = NADCoordinator(hass, entry, client)
 
-    # Store client in hass.data
+    # Store coordinator in hass.data
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = client
+    hass.data[DOMAIN][entry.entry_id] = coordinator
+
+    # Seed the client from the persisted device cache so the first connect
+    # doesn't block on re-polling model/firmware/source config
+    await coordinator.async_load_device_cache()
+
+    # Apply option changes in place instead of reloading the entry
+    entry.async_on_unload(entry.add_update_listener(async_update_listener))
 
     # Forward the setup to the media_player platform
     # The media_player entity will set up callbacks
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Connect to the device
-    return await client.connect()
+    # Connect in the background so a slow or offline AVR doesn't hold up
+    # HA startup; the client keeps retrying and drives entity state via
+    # its status/update callbacks once the connection comes up
+    entry.async_create_background_task(
+        hass, client.connect(), name=f"{DOMAIN}_connect_{entry.entry_id}"
+    )
+
+    return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -40,14 +57,30 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        # Disconnect and remove client
-        client = hass.data[DOMAIN].pop(entry.entry_id)
+        # Disconnect and remove client, closing any pooled connections.
+        # Drain by the client's actual address: during a reconfigure
+        # entry.data already holds the new host while the parked
+        # connection is keyed by the old one
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        client = coordinator.client
         await client.disconnect()
+        await NADConnectionPool.drain(client.host, client.port)
 
     return unload_ok
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted device cache along with the entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+
+
+async def async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply updated options to the running coordinator.
+
+    Options like scan_interval can be applied in place; only destructive
+    changes (host/port via reconfigure) go through a full entry reload,
+    which avoids tearing down the TCP connection for an interval tweak.
+    """
+    coordinator: NADCoordinator = hass.data[DOMAIN][entry.entry_id]
+    scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    coordinator.update_interval = timedelta(seconds=scan_interval)
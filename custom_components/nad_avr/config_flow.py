@@ -6,12 +6,18 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
 
-from .const import DEFAULT_NAME, DEFAULT_PORT, DOMAIN
+from .const import (
+    DEFAULT_NAME,
+    DEFAULT_PORT,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    MIN_SCAN_INTERVAL,
+)
 from .nad_client import NADClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,16 +32,18 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     client = NADClient(host, port)
 
     try:
-        connected = await client.connect()
+        connected = await client.connect(retry=False)
         if not connected:
             raise ConnectionError("Could not connect to NAD AVR")
 
-        await client.disconnect()
-
         return {"title": data.get(CONF_NAME, f"NAD AVR {host}")}
     except Exception as err:
         _LOGGER.error("Connection test failed: %s", err)
         raise
+    finally:
+        # Always tear the probe client down, success or not, so a failed
+        # validation can't leave a background task holding the bridge
+        await client.disconnect()
 
 
 class NADAVRConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -43,6 +51,14 @@ class NADAVRConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> "NADAVROptionsFlow":
+        """Get the options flow for this handler."""
+        return NADAVROptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -113,3 +129,27 @@ class NADAVRConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="reconfigure", data_schema=data_schema, errors=errors
         )
+
+
+class NADAVROptionsFlow(config_entries.OptionsFlow):
+    """Handle NAD AVR options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        data_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_SCAN_INTERVAL,
+                    default=self.config_entry.options.get(
+                        CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+                    ),
+                ): vol.All(cv.positive_int, vol.Range(min=MIN_SCAN_INTERVAL)),
+            }
+        )
+
+        return self.async_show_form(step_id="init", data_schema=data_schema)
@@ -1,26 +1,60 @@
 """Constants for the NAD AVR integration."""
 
+from datetime import timedelta
+
+__all__ = [
+    "CMD_MUTE_OFF",
+    "CMD_MUTE_ON",
+    "CMD_MUTE_QUERY",
+    "CMD_POWER_OFF",
+    "CMD_POWER_ON",
+    "CMD_POWER_QUERY",
+    "CMD_SOURCE_QUERY",
+    "CMD_SOURCE_SET",
+    "CMD_VOLUME_DOWN",
+    "CMD_VOLUME_QUERY",
+    "CMD_VOLUME_UP",
+    "DEFAULT_NAME",
+    "DEFAULT_PORT",
+    "DEFAULT_SCAN_INTERVAL",
+    "DEFAULT_SOURCE_LIST",
+    "DOMAIN",
+    "MIN_SCAN_INTERVAL",
+    "SCAN_INTERVAL",
+    "SOURCE_NAMES",
+    "SOURCE_SET_BYTES",
+    "SOURCES",
+    "VOLUME_DB_TO_LEVEL",
+    "VOLUME_MAX_DB",
+    "VOLUME_MIN_DB",
+    "VOLUME_RANGE_DB",
+    "VOLUME_SET_BYTES",
+]
+
 DOMAIN = "nad_avr"
 
 # Defaults
 DEFAULT_PORT = 23
 DEFAULT_NAME = "NAD AVR"
 
-# Update interval
-SCAN_INTERVAL = 30
-
-# NAD Commands
-CMD_POWER_ON = "Main.Power=On\r\n"
-CMD_POWER_OFF = "Main.Power=Off\r\n"
-CMD_POWER_QUERY = "Main.Power?\r\n"
-CMD_VOLUME_UP = "Main.Volume+\r\n"
-CMD_VOLUME_DOWN = "Main.Volume-\r\n"
-CMD_VOLUME_QUERY = "Main.Volume?\r\n"
-CMD_VOLUME_SET = "Main.Volume={}\r\n"
-CMD_MUTE_ON = "Main.Mute=On\r\n"
-CMD_MUTE_OFF = "Main.Mute=Off\r\n"
-CMD_MUTE_QUERY = "Main.Mute?\r\n"
-CMD_SOURCE_QUERY = "Main.Source?\r\n"
+# Update interval; users can widen it via the options flow
+DEFAULT_SCAN_INTERVAL = 30
+MIN_SCAN_INTERVAL = 5
+SCAN_INTERVAL = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+# NAD Commands, pre-encoded in the wire format so the transport can
+# write them without a per-call str.format/encode
+CMD_POWER_ON = b"Main.Power=On\r\n"
+CMD_POWER_OFF = b"Main.Power=Off\r\n"
+CMD_POWER_QUERY = b"Main.Power?\r\n"
+CMD_VOLUME_UP = b"Main.Volume+\r\n"
+CMD_VOLUME_DOWN = b"Main.Volume-\r\n"
+CMD_VOLUME_QUERY = b"Main.Volume?\r\n"
+CMD_MUTE_ON = b"Main.Mute=On\r\n"
+CMD_MUTE_OFF = b"Main.Mute=Off\r\n"
+CMD_MUTE_QUERY = b"Main.Mute?\r\n"
+CMD_SOURCE_QUERY = b"Main.Source?\r\n"
+# Template for source ids without a precomputed entry in SOURCE_SET_BYTES
 CMD_SOURCE_SET = "Main.Source={}\r\n"
 
 # NAD Sources - Common inputs for NAD AVRs
@@ -39,7 +73,26 @@ SOURCES = {
 # Reverse mapping
 SOURCE_NAMES = {v: k for k, v in SOURCES.items()}
 
+# Default source list, frozen once at import
+DEFAULT_SOURCE_LIST: tuple[str, ...] = tuple(SOURCES.values())
+
+# Pre-encoded source select commands for the known source ids
+SOURCE_SET_BYTES = {
+    source_id: CMD_SOURCE_SET.format(source_id).encode() for source_id in SOURCES
+}
+
 # Volume range (NAD uses -90 to 0 dB)
 VOLUME_MIN_DB = -90
 VOLUME_MAX_DB = 0
 VOLUME_RANGE_DB = VOLUME_MAX_DB - VOLUME_MIN_DB  # 90
+
+# Precomputed dB -> 0.0-1.0 level table, indexed by (volume_db - VOLUME_MIN_DB)
+VOLUME_DB_TO_LEVEL = tuple(
+    max(0.0, min(1.0, (db - VOLUME_MIN_DB) / VOLUME_RANGE_DB))
+    for db in range(VOLUME_MIN_DB, VOLUME_MAX_DB + 1)
+)
+
+# Pre-encoded volume set commands, indexed by (volume_db - VOLUME_MIN_DB)
+VOLUME_SET_BYTES = tuple(
+    f"Main.Volume={db}\r\n".encode() for db in range(VOLUME_MIN_DB, VOLUME_MAX_DB + 1)
+)
@@ -0,0 +1,101 @@
+"""DataUpdateCoordinator for the NAD AVR integration."""
+
+from dataclasses import asdict
+from datetime import timedelta
+import logging
+import time
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import (
+    CMD_MUTE_QUERY,
+    CMD_POWER_QUERY,
+    CMD_SOURCE_QUERY,
+    CMD_VOLUME_QUERY,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+)
+from .nad_client import NADClient, SourceInfo
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Persisted device info is trusted for a day; unsolicited updates and
+# explicit invalidation refresh it sooner
+DEVICE_CACHE_TTL = 86400  # seconds
+
+
+class NADCoordinator(DataUpdateCoordinator[dict[str, str]]):
+    """Coordinator feeding all NAD AVR entities from one batched fetch.
+
+    Entities read the last parsed values from ``coordinator.data``, a dict
+    keyed by the protocol key (e.g. "Main.Power"). Unsolicited device
+    updates are still pushed to entities directly by the client.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, client: NADClient
+    ) -> None:
+        """Initialize the coordinator."""
+        scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{entry.entry_id}",
+            update_interval=timedelta(seconds=scan_interval),
+        )
+        self.client = client
+        self.store: Store[dict] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}"
+        )
+
+    async def async_load_device_cache(self) -> None:
+        """Seed the client from persisted device info.
+
+        Restoring model, firmware and source config from disk means a
+        restart doesn't block on ~18 round-trips for values that almost
+        never change; the polls short-circuit on the seeded state.
+        """
+        data = await self.store.async_load()
+        if not data or time.time() - data.get("ts", 0) > DEVICE_CACHE_TTL:
+            return
+        self.client.model = data.get("model")
+        self.client.firmware_version = data.get("firmware_version")
+        if data.get("sources"):
+            self.client.restore_sources(
+                [SourceInfo(**source) for source in data["sources"]]
+            )
+        _LOGGER.debug("Restored device cache for %s", self.client.host)
+
+    async def async_save_device_cache(self) -> None:
+        """Persist polled device info for the next restart."""
+        await self.store.async_save(
+            {
+                "model": self.client.model,
+                "firmware_version": self.client.firmware_version,
+                "sources": [asdict(source) for source in self.client.sources],
+                "ts": time.time(),
+            }
+        )
+
+    async def _async_update_data(self) -> dict[str, str]:
+        """Fetch the main-zone state in one batched query."""
+        if not self.client.connected:
+            raise UpdateFailed("Not connected to NAD AVR")
+
+        responses = await self.client.query_many(
+            [CMD_POWER_QUERY, CMD_VOLUME_QUERY, CMD_MUTE_QUERY, CMD_SOURCE_QUERY]
+        )
+        if not responses:
+            raise UpdateFailed("No response from NAD AVR")
+
+        # Merge into the previous data so a partial response (e.g. the AVR
+        # not reporting volume while in standby) keeps the last known values
+        data = dict(self.data or {})
+        for key, response in responses.items():
+            data[key] = response.partition("=")[2].strip()
+        return data
@@ -1,6 +1,7 @@
 """Media player platform for NAD AVR."""
 
 import logging
+import re
 from typing import Any
 
 from homeassistant.components.media_player import (
@@ -10,32 +11,51 @@ from homeassistant.components.media_player import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CMD_MUTE_OFF,
     CMD_MUTE_ON,
-    CMD_MUTE_QUERY,
     CMD_POWER_OFF,
     CMD_POWER_ON,
-    CMD_POWER_QUERY,
-    CMD_SOURCE_QUERY,
     CMD_SOURCE_SET,
     CMD_VOLUME_DOWN,
-    CMD_VOLUME_QUERY,
-    CMD_VOLUME_SET,
     CMD_VOLUME_UP,
+    DEFAULT_SOURCE_LIST,
     DOMAIN,
     SOURCE_NAMES,
+    SOURCE_SET_BYTES,
     SOURCES,
+    VOLUME_DB_TO_LEVEL,
     VOLUME_MIN_DB,
     VOLUME_RANGE_DB,
+    VOLUME_SET_BYTES,
 )
-from .nad_client import NADClient
+from .coordinator import NADCoordinator
+from .nad_client import ConnectionStatus
 
 _LOGGER = logging.getLogger(__name__)
 
+# Matches every update message the entity consumes, compiled once at import
+_UPDATE_RE = re.compile(
+    r"^(Main\.Power|Main\.Volume|Main\.Mute|Main\.Source|Source(\d+)\.(Name|Enabled))=(.*)$"
+)
+
+# Values the AVR uses to report an enabled/true state
+_TRUE_VALUES = frozenset({"yes", "on", "true", "1"})
+
+
+def _is_truthy(value: str) -> bool:
+    """Return True if the AVR reports an on/enabled state."""
+    return value.casefold() in _TRUE_VALUES
+
+
+# Cheap prefix filter applied before the regex; chatty firmware also emits
+# zone/tone/trigger messages the entity cannot consume
+_UPDATE_PREFIXES = ("Main.Power", "Main.Volume", "Main.Mute", "Main.Source", "Source")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -43,18 +63,29 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the NAD AVR media player."""
-    client = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: NADCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     name = config_entry.data.get(CONF_NAME, f"NAD AVR {config_entry.data[CONF_HOST]}")
     host = config_entry.data[CONF_HOST]
 
     async_add_entities(
-        [NADAVRMediaPlayer(client, name, host, config_entry.entry_id)], True
+        [NADAVRMediaPlayer(coordinator, name, host, config_entry.entry_id)]
     )
 
 
-class NADAVRMediaPlayer(MediaPlayerEntity):
+class NADAVRMediaPlayer(CoordinatorEntity[NADCoordinator], MediaPlayerEntity):
     """Representation of a NAD AVR media player."""
 
+    # Our own attributes live in slots; the HA base classes still provide
+    # __dict__ for the _attr_* machinery
+    __slots__ = (
+        "_client",
+        "_host",
+        "_entry_id",
+        "_device_name",
+        "_source_list_dirty",
+        "_source_list_scheduled",
+    )
+
     _attr_has_entity_name = True
     _attr_name = None
     _attr_supported_features = (
@@ -66,27 +97,36 @@ class NADAVRMediaPlayer(MediaPlayerEntity):
         | MediaPlayerEntityFeature.SELECT_SOURCE
     )
 
-    def __init__(self, client: NADClient, name: str, host: str, entry_id: str) -> None:
+    def __init__(
+        self, coordinator: NADCoordinator, name: str, host: str, entry_id: str
+    ) -> None:
         """Initialize the NAD AVR media player."""
-        self._client = client
+        super().__init__(coordinator)
+        self._client = coordinator.client
         self._host = host
         self._entry_id = entry_id
         self._device_name = name
         self._attr_unique_id = f"{entry_id}_media_player"
-        self._attr_available = False
         self._attr_state = MediaPlayerState.OFF
         self._attr_is_volume_muted = False
         self._attr_volume_level = 0.0
         self._attr_source = None
-        self._attr_source_list = list(SOURCES.values())
+        self._attr_source_list = list(DEFAULT_SOURCE_LIST)
+        self._attr_device_info = self._build_device_info()
+        self._source_list_dirty = False
+        self._source_list_scheduled = False
 
         # Set up callbacks
-        client.status_callback = self._connection_status_changed
-        client.update_callback = self._handle_update
+        self._client.status_callback = self._connection_status_changed
+        self._client.update_callback = self._handle_update
 
     @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
+    def available(self) -> bool:
+        """Return if the entity is available."""
+        return self._client.connected
+
+    def _build_device_info(self) -> dict[str, Any]:
+        """Build the device information dict."""
         info = {
             "identifiers": {(DOMAIN, self._entry_id)},
             "name": self._device_name,
@@ -101,212 +141,208 @@ class NADAVRMediaPlayer(MediaPlayerEntity):
 
         return info
 
-    async def _connection_status_changed(self, connected: bool) -> None:
+    async def _connection_status_changed(self, status: ConnectionStatus) -> None:
         """Handle connection status changes."""
-        self._attr_available = connected
-        if not connected:
+        if status != "connected":
+            # "disconnected" and terminal "error" both render as unavailable;
+            # the client's reconnect loop decides which one we are in
             self._attr_state = MediaPlayerState.OFF
             self.async_write_ha_state()
-        else:
-            # Poll device info (model and firmware version)
-            await self._client.poll_device_info()
+            return
 
-            # Poll source names from the device
-            await self._client.poll_source_names()
-            self._update_source_list()
+        # Poll device info (model and firmware version)
+        await self._client.poll_device_info()
+        self._attr_device_info = self._build_device_info()
 
-            # Write state after updating source list
-            self.async_write_ha_state()
+        # Poll source names from the device
+        await self._client.poll_source_names()
+        self._update_source_list()
+
+        # Write state after updating source list
+        self.async_write_ha_state()
 
-            # Poll initial state (power, volume, mute, source)
-            await self.async_update()
-
-    def _update_source_list(self) -> None:
-        """Update the source list with polled names, filtering out disabled sources."""
-        if self._client.source_enabled:
-            # Only include sources that are enabled
-            enabled_sources = [
-                source_id
-                for source_id in sorted(self._client.source_enabled.keys())
-                if self._client.source_enabled.get(source_id, False)
+        # Persist the polled device info for the next restart
+        await self.coordinator.async_save_device_cache()
+
+        # Poll initial state (power, volume, mute, source)
+        await self.coordinator.async_request_refresh()
+
+    def _compute_source_list(self) -> list[str]:
+        """Compute the source list with polled names, filtering out disabled sources."""
+        if self._client.enabled_sources:
+            # Use the polled name if available, otherwise fall back to default
+            return [
+                source.name or SOURCES.get(source.id, f"Source {source.id}")
+                for source in self._client.enabled_sources
             ]
 
-            # Use polled names for enabled sources
-            self._attr_source_list = []
-            for source_id in enabled_sources:
-                # Use the polled name if available, otherwise fall back to default
-                source_name = self._client.source_names.get(source_id)
-                if not source_name:
-                    source_name = SOURCES.get(source_id, f"Source {source_id}")
-                self._attr_source_list.append(source_name)
-
-        elif self._client.source_names:
-            # If no enabled info but we have names, use all sources with names
-            self._attr_source_list = list(self._client.source_names.values())
-        else:
-            # Use default names if polling failed
-            self._attr_source_list = list(SOURCES.values())
+        # If no enabled info but we have names, use all sources with names
+        named = [source.name for source in self._client.sources if source.name]
+        if named:
+            return named
+
+        # Use default names if polling failed
+        return list(DEFAULT_SOURCE_LIST)
+
+    def _update_source_list(self) -> bool:
+        """Recompute the source list; return True if it actually changed."""
+        source_list = self._compute_source_list()
+        if source_list == self._attr_source_list:
+            return False
+        self._attr_source_list = source_list
+        return True
+
+    def _mark_source_list_dirty(self) -> None:
+        """Schedule a single coalesced source-list recompute on the next loop tick."""
+        self._source_list_dirty = True
+        if not self._source_list_scheduled:
+            self._source_list_scheduled = True
+            self.hass.loop.call_soon(self._flush_source_list)
+
+    def _flush_source_list(self) -> None:
+        """Recompute the source list once per burst of source updates."""
+        self._source_list_scheduled = False
+        if not self._source_list_dirty:
+            return
+        self._source_list_dirty = False
+        if self._update_source_list():
+            self.async_write_ha_state()
+            # Renames/enable toggles made on the AVR itself should survive
+            # a restart too
+            self.hass.async_create_task(self.coordinator.async_save_device_cache())
+
+    def _apply_power(self, value: str) -> bool:
+        """Apply a power state update; return True if the state changed."""
+        new_state = (
+            MediaPlayerState.ON if _is_truthy(value) else MediaPlayerState.OFF
+        )
+        if self._attr_state != new_state:
+            self._attr_state = new_state
+            return True
+        return False
+
+    def _apply_volume(self, value: str) -> bool:
+        """Apply a volume update; return True if the state changed."""
+        try:
+            volume_db = int(value)
+        except ValueError:
+            return False
+        new_volume = VOLUME_DB_TO_LEVEL[
+            max(0, min(VOLUME_RANGE_DB, volume_db - VOLUME_MIN_DB))
+        ]
+        if (
+            self._attr_volume_level is None
+            or abs(self._attr_volume_level - new_volume) > 0.001
+        ):
+            self._attr_volume_level = new_volume
+            return True
+        return False
+
+    def _apply_mute(self, value: str) -> bool:
+        """Apply a mute update; return True if the state changed."""
+        new_mute = _is_truthy(value)
+        if self._attr_is_volume_muted != new_mute:
+            self._attr_is_volume_muted = new_mute
+            return True
+        return False
+
+    def _apply_source(self, value: str) -> bool:
+        """Apply a source update; return True if the state changed."""
+        # Use polled name if available, otherwise use default
+        source_info = self._client.get_source(value)
+        new_source = (
+            source_info.name
+            if source_info and source_info.name
+            else SOURCES.get(value, value)
+        )
+        if self._attr_source != new_source:
+            self._attr_source = new_source
+            return True
+        return False
+
+    def _apply_source_enabled(self, source_num: str, value: str) -> bool:
+        """Apply a source enabled-status update; return True if the list changed."""
+        is_enabled = _is_truthy(value)
+        source_info = self._client.get_source(source_num)
+        if source_info is not None and source_info.enabled == is_enabled:
+            return False
+        self._client.set_source_enabled(source_num, is_enabled)
+        _LOGGER.debug("Source %s enabled status updated to: %s", source_num, is_enabled)
+        # Coalesce the source-list recompute; the flush writes state itself
+        self._mark_source_list_dirty()
+        return False
+
+    def _apply_source_name(self, source_num: str, value: str) -> bool:
+        """Apply a source name update; return True if the list changed."""
+        source_info = self._client.get_source(source_num)
+        if not value or (source_info is not None and source_info.name == value):
+            return False
+        self._client.set_source_name(source_num, value)
+        _LOGGER.debug("Source %s name updated to: %s", source_num, value)
+        # Coalesce the source-list recompute; the flush writes state itself
+        self._mark_source_list_dirty()
+        return False
+
+    # Dispatch table for Main.* updates; Source<n>.* is routed by regex groups
+    _HANDLERS = {
+        "Main.Power": _apply_power,
+        "Main.Volume": _apply_volume,
+        "Main.Mute": _apply_mute,
+        "Main.Source": _apply_source,
+    }
 
     async def _handle_update(self, message: str) -> None:
         """Handle unsolicited updates from the device."""
-        if not message or "=" not in message:
+        if not message or not message.startswith(_UPDATE_PREFIXES):
             return
 
-        state_changed = False
-
-        try:
-            key, value = message.split("=", 1)
-            key = key.strip()
-            value = value.strip()
-
-            # Handle power state updates
-            if key == "Main.Power":
-                new_state = (
-                    MediaPlayerState.ON
-                    if value.lower() == "on"
-                    else MediaPlayerState.OFF
-                )
-                if self._attr_state != new_state:
-                    self._attr_state = new_state
-                    state_changed = True
-
-            # Handle volume updates
-            elif key == "Main.Volume":
-                try:
-                    volume_db = int(value)
-                    new_volume = max(
-                        0.0, min(1.0, (volume_db - VOLUME_MIN_DB) / VOLUME_RANGE_DB)
-                    )
-                    if (
-                        self._attr_volume_level is None
-                        or abs(self._attr_volume_level - new_volume) > 0.001
-                    ):
-                        self._attr_volume_level = new_volume
-                        state_changed = True
-                except ValueError:
-                    pass
-
-            # Handle mute updates
-            elif key == "Main.Mute":
-                new_mute = value.lower() == "on"
-                if self._attr_is_volume_muted != new_mute:
-                    self._attr_is_volume_muted = new_mute
-                    state_changed = True
-
-            # Handle source updates
-            elif key == "Main.Source":
-                # Use polled name if available, otherwise use default
-                new_source = self._client.source_names.get(
-                    value, SOURCES.get(value, value)
-                )
-                if self._attr_source != new_source:
-                    self._attr_source = new_source
-                    state_changed = True
-
-            # Handle source enabled status updates
-            elif key.startswith("Source") and key.endswith(".Enabled"):
-                # Extract source number from key (e.g., "Source1.Enabled" -> "1")
-                try:
-                    source_num = key.replace("Source", "").replace(".Enabled", "")
-                    is_enabled = value.lower() in ["yes", "on", "true", "1"]
-                    # Check if the enabled status actually changed
-                    if self._client.source_enabled.get(source_num) != is_enabled:
-                        self._client.source_enabled[source_num] = is_enabled
-                        _LOGGER.debug(
-                            "Source %s enabled status updated to: %s",
-                            source_num,
-                            is_enabled,
-                        )
-                        # Update the source list when enabled status changes
-                        old_source_list = (
-                            list(self._attr_source_list)
-                            if self._attr_source_list
-                            else []
-                        )
-                        self._update_source_list()
-                        if self._attr_source_list != old_source_list:
-                            state_changed = True
-                except (ValueError, IndexError):
-                    _LOGGER.debug(
-                        "Could not parse source enabled update: %s=%s", key, value
-                    )
-
-            # Handle source name updates
-            elif key.startswith("Source") and key.endswith(".Name"):
-                # Extract source number from key (e.g., "Source1.Name" -> "1")
-                try:
-                    source_num = key.replace("Source", "").replace(".Name", "")
-                    if value and self._client.source_names.get(source_num) != value:
-                        self._client.source_names[source_num] = value
-                        _LOGGER.debug(
-                            "Source %s name updated to: %s", source_num, value
-                        )
-                        # Update the source list when name changes
-                        old_source_list = (
-                            list(self._attr_source_list)
-                            if self._attr_source_list
-                            else []
-                        )
-                        self._update_source_list()
-                        if self._attr_source_list != old_source_list:
-                            state_changed = True
-                except (ValueError, IndexError):
-                    _LOGGER.debug(
-                        "Could not parse source name update: %s=%s", key, value
-                    )
-
-            # Update the state in Home Assistant only if something changed
-            if state_changed:
-                self.async_write_ha_state()
-
-        except (ValueError, KeyError, AttributeError) as err:
-            _LOGGER.debug("Error parsing update message '%s': %s", message, err)
-
-    async def async_update(self) -> None:
-        """Update the state of the media player."""
-        if not self._client.connected:
-            self._attr_available = False
-            self._attr_state = MediaPlayerState.OFF
+        # Single compiled-regex scan replaces the startswith/endswith chains
+        match = _UPDATE_RE.match(message)
+        if not match:
+            _LOGGER.debug("Ignoring unhandled update message: %s", message)
             return
 
-        self._attr_available = True
+        key, source_num, source_attr, value = match.groups()
+        value = value.strip()
 
-        # Query power state
-        response = await self._client.query(CMD_POWER_QUERY)
-        if response and "=" in response:
-            value = response.split("=", 1)[1].strip()
-            if value.lower() == "on":
-                self._attr_state = MediaPlayerState.ON
+        if source_num:
+            if source_attr == "Enabled":
+                state_changed = self._apply_source_enabled(source_num, value)
             else:
-                self._attr_state = MediaPlayerState.OFF
+                state_changed = self._apply_source_name(source_num, value)
+        else:
+            state_changed = self._HANDLERS[key](self, value)
+
+        # Update the state in Home Assistant only if something changed
+        if state_changed:
+            self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Apply the coordinator's polled data to the entity state."""
+        data = self.coordinator.data or {}
+        state_changed = False
+
+        value = data.get("Main.Power")
+        if value is not None:
+            state_changed |= self._apply_power(value)
 
         if self._attr_state == MediaPlayerState.ON:
-            # Query volume
-            response = await self._client.query(CMD_VOLUME_QUERY)
-            if response and "=" in response:
-                try:
-                    volume_db = int(response.split("=", 1)[1].strip())
-                    # Convert to 0.0-1.0 range
-                    self._attr_volume_level = max(
-                        0.0, min(1.0, (volume_db - VOLUME_MIN_DB) / VOLUME_RANGE_DB)
-                    )
-                except (ValueError, IndexError):
-                    pass
-
-            # Query mute state
-            response = await self._client.query(CMD_MUTE_QUERY)
-            if response and "=" in response:
-                value = response.split("=", 1)[1].strip()
-                self._attr_is_volume_muted = value.lower() == "on"
-
-            # Query source
-            response = await self._client.query(CMD_SOURCE_QUERY)
-            if response and "=" in response:
-                source_id = response.split("=", 1)[1].strip()
-                # Use polled name if available, otherwise use default
-                self._attr_source = self._client.source_names.get(
-                    source_id, SOURCES.get(source_id, source_id)
-                )
+            value = data.get("Main.Volume")
+            if value is not None:
+                state_changed |= self._apply_volume(value)
+
+            value = data.get("Main.Mute")
+            if value is not None:
+                state_changed |= self._apply_mute(value)
+
+            value = data.get("Main.Source")
+            if value is not None:
+                state_changed |= self._apply_source(value)
+
+        # Only fan out to websocket/recorder subscribers if something changed
+        if state_changed:
+            super()._handle_coordinator_update()
 
     async def async_turn_on(self) -> None:
         """Turn the media player on."""
@@ -328,9 +364,11 @@ class NADAVRMediaPlayer(MediaPlayerEntity):
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
-        # Convert 0.0-1.0 to NAD dB range
+        # Convert 0.0-1.0 to NAD dB range and pick the pre-encoded command
         volume_db = int((volume * VOLUME_RANGE_DB) + VOLUME_MIN_DB)
-        await self._client.send_command(CMD_VOLUME_SET.format(volume_db))
+        await self._client.send_command(
+            VOLUME_SET_BYTES[max(0, min(VOLUME_RANGE_DB, volume_db - VOLUME_MIN_DB))]
+        )
         # Let the device update callback handle the state change
 
     async def async_volume_up(self) -> None:
@@ -343,19 +381,14 @@ class NADAVRMediaPlayer(MediaPlayerEntity):
 
     async def async_select_source(self, source: str) -> None:
         """Select input source."""
-        # Find source ID by matching against polled names or defaults
-        source_id = None
-
-        # Check polled names first
-        for sid, name in self._client.source_names.items():
-            if name == source:
-                source_id = sid
-                break
-
-        # Fall back to default names
-        if not source_id:
-            source_id = SOURCE_NAMES.get(source)
+        # Look up the source ID via the reverse index, falling back to defaults
+        source_id = self._client.source_name_to_id.get(source) or SOURCE_NAMES.get(
+            source
+        )
 
         if source_id:
-            await self._client.send_command(CMD_SOURCE_SET.format(source_id))
+            command = SOURCE_SET_BYTES.get(source_id)
+            if command is None:
+                command = CMD_SOURCE_SET.format(source_id).encode()
+            await self._client.send_command(command)
             # Let the device update callback handle the state change
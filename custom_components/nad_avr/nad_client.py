@@ -1,14 +1,162 @@
 """NAD AVR TCP client with auto-reconnect."""
 
 import asyncio
+from collections import defaultdict, deque
 from collections.abc import Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 import logging
+import math
+import random
+import re
+import socket
+import time
+from typing import Literal
 
 _LOGGER = logging.getLogger(__name__)
 
-RECONNECT_DELAY = 5  # seconds
-READ_TIMEOUT = 10  # seconds
+ConnectionStatus = Literal["connected", "disconnected", "error"]
+
+RECONNECT_BACKOFF_BASE = 1.0  # seconds
+RECONNECT_BACKOFF_CAP = 300.0  # seconds
+# Reconnect attempts before giving up with an "error" status; None = retry forever
+MAX_RECONNECT_ATTEMPTS: int | None = None
 CONNECT_TIMEOUT = 10  # seconds
+POOL_IDLE_TIMEOUT = 30  # seconds
+# Write-buffer tuning: tight limits so drain() reflects real backpressure
+WRITE_BUFFER_HIGH = 8192  # bytes
+WRITE_BUFFER_LOW = 2048  # bytes
+DRAIN_THRESHOLD = 4096  # bytes of buffered data before we bother draining
+SOURCE_CACHE_TTL = 3600  # seconds; source config rarely changes
+MAX_SOURCES = 16
+
+# Per-source query commands, encoded once at import instead of on every poll
+SOURCE_ENABLED_CMDS: list[bytes] = [
+    f"Source{n}.Enabled?\r\n".encode("ascii") for n in range(1, MAX_SOURCES + 1)
+]
+SOURCE_NAME_CMDS: list[bytes] = [
+    f"Source{n}.Name?\r\n".encode("ascii") for n in range(1, MAX_SOURCES + 1)
+]
+
+# Live state keys the entity consumes as push updates; the reader can
+# classify lines with these keys as unsolicited without a pending lookup
+UNSOLICITED_PREFIXES: frozenset[bytes] = frozenset(
+    {b"Main.Power", b"Main.Volume", b"Main.Mute", b"Main.Source"}
+)
+
+# Query keys whose responses may be served from cache without a round-trip;
+# live state (Main.Power/Volume/Mute/Source) is deliberately absent
+QUERY_CACHE_TTL: dict[bytes, float] = {
+    b"Main.Model": math.inf,
+    b"Main.Version": math.inf,
+}
+SOURCE_QUERY_CACHE_TTL = 300.0  # seconds, for Source<n>.Name/Enabled
+
+# Matches an enabled/true value in a Source<n>.Enabled=... response in one
+# scan, with no intermediate split/strip/lower copies
+_ENABLED_RE = re.compile(r"=\s*(?:yes|on|true|1)\s*$", re.IGNORECASE)
+
+
+def _cache_ttl_for(key: bytes) -> float | None:
+    """Return the cache TTL for a query key, or None if never cached."""
+    ttl = QUERY_CACHE_TTL.get(key)
+    if ttl is not None:
+        return ttl
+    if key.startswith(b"Source"):
+        return SOURCE_QUERY_CACHE_TTL
+    return None
+
+
+@dataclass(slots=True)
+class SourceInfo:
+    """One device source: stable id plus its polled name and enabled flag."""
+
+    id: str
+    name: str = ""
+    enabled: bool = False
+
+
+class NADConnectionPool:
+    """Small LIFO pool of warm TCP connections keyed by (host, port).
+
+    NAD serial-over-TCP bridges are flaky on rapid reconnects, so the
+    connection opened while validating a config entry is kept warm and
+    reused by the subsequent entry setup instead of being torn down and
+    immediately reopened. Idle connections are discarded after
+    POOL_IDLE_TIMEOUT seconds.
+    """
+
+    _pools: dict[
+        tuple[str, int],
+        list[tuple[float, asyncio.StreamReader, asyncio.StreamWriter]],
+    ] = {}
+
+    @classmethod
+    async def acquire(
+        cls, host: str, port: int
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Return a pooled connection if one is still healthy, else open one."""
+        pool = cls._pools.get((host, port), [])
+        while pool:
+            idle_since, reader, writer = pool.pop()
+            if (
+                writer.is_closing()
+                or time.monotonic() - idle_since > POOL_IDLE_TIMEOUT
+            ):
+                writer.close()
+                continue
+            _LOGGER.debug("Reusing pooled connection to %s:%s", host, port)
+            return reader, writer
+
+        return await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout=CONNECT_TIMEOUT
+        )
+
+    @classmethod
+    def release(
+        cls, host: str, port: int, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Return a healthy connection to the pool for reuse."""
+        if writer.is_closing():
+            return
+        cls._pools.setdefault((host, port), []).append(
+            (time.monotonic(), reader, writer)
+        )
+        # Sweep shortly after the idle timeout so a parked connection is
+        # actually closed, not just skipped by a later acquire that may
+        # never come (e.g. an aborted config flow)
+        asyncio.get_running_loop().call_later(
+            POOL_IDLE_TIMEOUT + 1, cls._sweep, host, port
+        )
+        _LOGGER.debug("Returned connection to %s:%s to the pool", host, port)
+
+    @classmethod
+    def _sweep(cls, host: str, port: int) -> None:
+        """Close pooled connections that have sat idle past the timeout."""
+        pool = cls._pools.get((host, port))
+        if not pool:
+            return
+        now = time.monotonic()
+        fresh = []
+        for idle_since, reader, writer in pool:
+            if writer.is_closing() or now - idle_since > POOL_IDLE_TIMEOUT:
+                writer.close()
+            else:
+                fresh.append((idle_since, reader, writer))
+        if fresh:
+            cls._pools[(host, port)] = fresh
+        else:
+            cls._pools.pop((host, port), None)
+
+    @classmethod
+    async def drain(cls, host: str, port: int) -> None:
+        """Close all pooled connections for a host."""
+        for _, _, writer in cls._pools.pop((host, port), []):
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except (OSError, AttributeError) as err:
+                _LOGGER.debug("Error closing pooled connection: %s", err)
 
 
 class NADClient:
@@ -22,16 +170,29 @@ class NADClient:
         self.port = port
         self.status_callback = status_callback
         self.update_callback: Callable | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
         self._connected = False
         self._reconnect_task: asyncio.Task | None = None
         self._read_task: asyncio.Task | None = None
+        self._update_queue: asyncio.Queue[str] = asyncio.Queue(maxsize=256)
+        self._update_worker: asyncio.Task | None = None
+        self._tx_queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self._tx_task: asyncio.Task | None = None
         self._should_reconnect = True
-        self._lock = asyncio.Lock()
-        self._pending_query: asyncio.Future | None = None
-        self.source_names: dict[str, str] = {}
-        self.source_enabled: dict[str, bool] = {}
+        self._current_backoff = RECONNECT_BACKOFF_BASE
+        self._reconnect_attempts = 0
+        # Waiters keyed by the raw bytes prefix so routing never decodes a
+        # line; a deque per key keeps repeated queries for the same key FIFO
+        self._pending: dict[bytes, deque[asyncio.Future]] = defaultdict(deque)
+        self._query_cache: dict[bytes, tuple[float, str]] = {}
+        self.sources: list[SourceInfo] = []
+        self.enabled_sources: tuple[SourceInfo, ...] = ()
+        self.source_name_to_id: dict[str, str] = {}
+        self._source_names_polled_at = 0.0
+        self._inflight_device_info: asyncio.Task | None = None
+        self._inflight_source_names: asyncio.Task | None = None
         self.firmware_version: str | None = None
         self.model: str | None = None
 
@@ -40,31 +201,140 @@ class NADClient:
         """Return if client is connected."""
         return self._connected
 
-    async def connect(self) -> bool:
-        """Connect to the NAD AVR."""
+    def get_source(self, source_id: str) -> SourceInfo | None:
+        """Return the source record for an id, if known."""
+        try:
+            index = int(source_id) - 1
+        except ValueError:
+            return None
+        if 0 <= index < len(self.sources):
+            return self.sources[index]
+        return None
+
+    def _source_entry(self, source_id: str) -> SourceInfo | None:
+        """Return the record for an id, growing the list for new sources.
+
+        Ids outside 1..MAX_SOURCES are rejected so a single corrupt
+        Source<n> line cannot grow the list without bound.
+        """
+        index = int(source_id) - 1
+        if not 0 <= index < MAX_SOURCES:
+            _LOGGER.debug("Ignoring out-of-range source id: %s", source_id)
+            return None
+        while len(self.sources) <= index:
+            self.sources.append(SourceInfo(str(len(self.sources) + 1)))
+        return self.sources[index]
+
+    def _refresh_enabled_sources(self) -> None:
+        """Rebuild the pre-filtered tuple the entity consumes directly."""
+        self.enabled_sources = tuple(s for s in self.sources if s.enabled)
+
+    def set_source_name(self, source_id: str, name: str) -> None:
+        """Set a source name, keeping the reverse name->id index in sync."""
+        source = self._source_entry(source_id)
+        if source is None:
+            return
+        if source.name and self.source_name_to_id.get(source.name) == source_id:
+            del self.source_name_to_id[source.name]
+        source.name = name
+        self.source_name_to_id[name] = source_id
+
+    def restore_sources(self, sources: list[SourceInfo]) -> None:
+        """Seed source state from persisted data so reconnects skip the poll."""
+        self.sources = sources
+        self.source_name_to_id = {s.name: s.id for s in sources if s.name}
+        self._refresh_enabled_sources()
+        self._source_names_polled_at = time.monotonic()
+
+    def set_source_enabled(self, source_id: str, enabled: bool) -> None:
+        """Set a source's enabled flag, refreshing the enabled tuple."""
+        source = self._source_entry(source_id)
+        if source is None:
+            return
+        source.enabled = enabled
+        self._refresh_enabled_sources()
+
+    async def connect(self, retry: bool = True) -> bool:
+        """Connect to the NAD AVR.
+
+        With retry enabled (the default), a failed attempt starts the
+        background reconnect loop; a one-shot probe such as config-flow
+        validation passes retry=False so no task outlives the caller.
+        """
         try:
             _LOGGER.debug("Connecting to NAD AVR at %s:%s", self.host, self.port)
-            self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self.host, self.port), timeout=CONNECT_TIMEOUT
+            self._loop = asyncio.get_running_loop()
+            self._reader, self._writer = await NADConnectionPool.acquire(
+                self.host, self.port
             )
+            self._enable_keepalive()
+            # NAD frames are tiny; with the default 64 KiB high-water mark
+            # drain() would never signal pressure until far too late
+            self._writer.transport.set_write_buffer_limits(
+                high=WRITE_BUFFER_HIGH, low=WRITE_BUFFER_LOW
+            )
+
+            # A reader from the previous connection may still be parked on
+            # its read; cancel it before going connected so two readers
+            # never consume the new stream (its _handle_disconnect is a
+            # no-op while we are still marked disconnected)
+            if self._read_task and not self._read_task.done():
+                self._read_task.cancel()
+                try:
+                    await self._read_task
+                except asyncio.CancelledError:
+                    pass
+
             self._connected = True
+            self._current_backoff = RECONNECT_BACKOFF_BASE
+            self._reconnect_attempts = 0
             _LOGGER.info("Connected to NAD AVR at %s:%s", self.host, self.port)
 
-            # Start reading responses
-            if self._read_task is None or self._read_task.done():
-                self._read_task = asyncio.create_task(self._read_responses())
+            # Start reading responses; any prior reader was cancelled above
+            self._read_task = asyncio.create_task(self._read_responses())
+
+            # Start the worker that delivers unsolicited updates
+            if self._update_worker is None or self._update_worker.done():
+                self._update_worker = asyncio.create_task(self._dispatch_updates())
+
+            # Start the writer task that flushes queued commands
+            if self._tx_task is None or self._tx_task.done():
+                self._tx_task = asyncio.create_task(self._tx_loop())
 
             if self.status_callback:
-                await self.status_callback(True)
+                await self.status_callback("connected")
 
             return True
         except (TimeoutError, OSError, ConnectionRefusedError) as err:
             _LOGGER.error("Failed to connect to NAD AVR: %s", err)
             self._connected = False
             if self.status_callback:
-                await self.status_callback(False)
+                await self.status_callback("disconnected")
+            # Keep retrying in the background so a failed initial connect
+            # (e.g. AVR offline during HA startup) eventually recovers
+            if retry and self._should_reconnect and (
+                self._reconnect_task is None or self._reconnect_task.done()
+            ):
+                self._reconnect_task = asyncio.create_task(self._reconnect_loop())
             return False
 
+    def _enable_keepalive(self) -> None:
+        """Enable TCP keepalive so the kernel detects half-open connections."""
+        sock = self._writer.get_extra_info("socket") if self._writer else None
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Linux probe tuning: declare a half-open link dead in ~60 s
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+            if hasattr(socket, "TCP_KEEPCNT"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+        except OSError as err:
+            _LOGGER.debug("Could not enable TCP keepalive: %s", err)
+
     async def disconnect(self):
         """Disconnect from the NAD AVR."""
         self._should_reconnect = False
@@ -83,12 +353,23 @@ class NADClient:
             except asyncio.CancelledError:
                 pass
 
-        if self._writer:
+        if self._update_worker and not self._update_worker.done():
+            self._update_worker.cancel()
             try:
-                self._writer.close()
-                await self._writer.wait_closed()
-            except (OSError, AttributeError) as err:
-                _LOGGER.debug("Error closing writer: %s", err)
+                await self._update_worker
+            except asyncio.CancelledError:
+                pass
+
+        if self._tx_task and not self._tx_task.done():
+            self._tx_task.cancel()
+            try:
+                await self._tx_task
+            except asyncio.CancelledError:
+                pass
+
+        if self._reader and self._writer:
+            # Keep the connection warm for a possible reconnect/revalidation
+            NADConnectionPool.release(self.host, self.port, self._reader, self._writer)
 
         self._connected = False
         self._reader = None
@@ -96,208 +377,463 @@ class NADClient:
         _LOGGER.info("Disconnected from NAD AVR")
 
     async def _read_responses(self):
-        """Read responses from the AVR."""
+        """Read responses from the AVR.
+
+        A persistent receive buffer is filled in 4 KiB chunks and split on
+        newlines here, so a burst of status lines (the AVR emits a volley
+        on source change) is parsed in one wakeup instead of one
+        readuntil() call per line.
+        """
+        rx_buf = bytearray()
+        # Hoist per-iteration attribute lookups to locals; the task is
+        # bound to exactly one connection, so the reader never changes
+        # under it and only the _connected flag needs re-reading
+        reader = self._reader
+        handle_line = self._handle_line
+        find = rx_buf.find
         try:
-            while self._connected and self._reader:
+            while self._connected and reader:
                 try:
-                    data = await asyncio.wait_for(
-                        self._reader.readuntil(b"\n"), timeout=READ_TIMEOUT
-                    )
-                    if not data:
+                    chunk = await reader.read(4096)
+                    if not chunk:
                         _LOGGER.warning("Connection closed by NAD AVR")
                         break
 
-                    response = data.decode("utf-8", errors="ignore").strip()
-                    if response:
-                        _LOGGER.debug("Received from NAD: %s", response)
-
-                        # If there's a pending query, resolve it with this response
-                        if self._pending_query and not self._pending_query.done():
-                            self._pending_query.set_result(response)
-                            self._pending_query = None
-                        # This is an unsolicited update from the device
-                        elif self.update_callback:
-                            try:
-                                await self.update_callback(response)
-                            except Exception as err:  # noqa: BLE001 # Allowed in background task
-                                _LOGGER.error("Error in update callback: %s", err)
-
-                except TimeoutError:
-                    # No data received, continue
-                    continue
-                except Exception as err:  # noqa: BLE001 # Allowed in background task
-                    _LOGGER.error("Error reading from NAD AVR: %s", err)
+                    rx_buf += chunk
+                    while (end := find(b"\n")) >= 0:
+                        line = bytes(rx_buf[:end]).rstrip(b"\r")
+                        del rx_buf[: end + 1]
+                        if line:
+                            handle_line(line)
+
+                except (ConnectionResetError, OSError) as err:
+                    # Expected on any network drop; the reconnect loop will
+                    # report at warning level if it cannot recover
+                    _LOGGER.info("Connection to NAD AVR dropped: %s", err)
                     break
-        except Exception as err:  # noqa: BLE001 # Allowed in background task
-            _LOGGER.error("Error in read loop: %s", err)
+        except Exception:  # noqa: BLE001 # Last-resort guard for the task
+            # Anything landing here is a bug (network teardown is handled
+            # above); it kills the reader, so make it loud
+            _LOGGER.exception("Unexpected error in read loop")
         finally:
             await self._handle_disconnect()
 
+    def _discard_waiter(self, key: bytes, future: asyncio.Future) -> None:
+        """Drop a waiter that is done with its round-trip, resolved or not."""
+        waiters = self._pending.get(key)
+        if waiters:
+            try:
+                waiters.remove(future)
+            except ValueError:
+                pass
+
+    @asynccontextmanager
+    async def _await_response(self, key: bytes):
+        """Register a waiter for a response key, deregistering on any exit.
+
+        Centralizes the cleanup the error arms in query() used to repeat:
+        however the block exits, the waiter leaves the pending map and an
+        unresolved future is cancelled rather than leaked.
+        """
+        future = self._loop.create_future()
+        self._pending[key].append(future)
+        try:
+            yield future
+        finally:
+            self._discard_waiter(key, future)
+            if not future.done():
+                future.cancel()
+
+    def _handle_line(self, line: bytes) -> None:
+        """Route one complete response line to its waiter or the update queue.
+
+        Parses at the bytes level; a line is only decoded once it is
+        actually delivered to a waiter or callback.
+        """
+        _LOGGER.debug("Received from NAD: %s", line)
+
+        key = line.partition(b"=")[0].strip()
+
+        # Fast path for live state keys, which are usually unsolicited
+        # pushes: only consult the pending map when a poll for the same
+        # key is actually in flight
+        if key not in UNSOLICITED_PREFIXES or self._pending.get(key):
+            # Route query responses to the oldest waiter for the key
+            waiters = self._pending.get(key)
+            if waiters:
+                future = waiters.popleft()
+                if not future.done():
+                    future.set_result(line.decode("utf-8", "ignore"))
+                return
+
+        # This is an unsolicited update from the device;
+        # queue it so a slow callback can't stall the reader
+        if self.update_callback:
+            # The device changed state on its own; any cached
+            # query result for this key is now stale
+            self._query_cache.pop(key, None)
+            response = line.decode("utf-8", "ignore")
+            try:
+                self._update_queue.put_nowait(response)
+            except asyncio.QueueFull:
+                # Drop the oldest update to keep the stream fresh
+                self._update_queue.get_nowait()
+                self._update_queue.put_nowait(response)
+
+    async def _dispatch_updates(self):
+        """Deliver queued unsolicited updates without blocking the reader."""
+        while True:
+            response = await self._update_queue.get()
+            if self.update_callback:
+                try:
+                    await self.update_callback(response)
+                except Exception as err:  # noqa: BLE001 # Allowed in background task
+                    _LOGGER.error("Error in update callback: %s", err)
+
     async def _handle_disconnect(self):
         """Handle disconnection and trigger reconnection."""
         if self._connected:
             _LOGGER.warning("Connection to NAD AVR lost")
             self._connected = False
 
+            # Close the dead transport; the reconnect opens a fresh one and
+            # single-session bridges reject it while the old one lingers
+            if self._writer and not self._writer.is_closing():
+                self._writer.close()
+
             # Cancel any pending queries
-            if self._pending_query and not self._pending_query.done():
-                self._pending_query.cancel()
-            self._pending_query = None
+            for waiters in self._pending.values():
+                for future in waiters:
+                    if not future.done():
+                        future.cancel()
+            self._pending.clear()
 
             if self.status_callback:
-                await self.status_callback(False)
+                await self.status_callback("disconnected")
 
             if self._should_reconnect:
                 if self._reconnect_task is None or self._reconnect_task.done():
                     self._reconnect_task = asyncio.create_task(self._reconnect_loop())
 
     async def _reconnect_loop(self):
-        """Reconnection loop."""
+        """Reconnection loop with decorrelated-jitter exponential backoff."""
         while self._should_reconnect and not self._connected:
-            _LOGGER.info(
-                "Attempting to reconnect to NAD AVR in %s seconds", RECONNECT_DELAY
+            if (
+                MAX_RECONNECT_ATTEMPTS is not None
+                and self._reconnect_attempts >= MAX_RECONNECT_ATTEMPTS
+            ):
+                _LOGGER.error(
+                    "Giving up on NAD AVR at %s:%s after %d reconnect attempts",
+                    self.host,
+                    self.port,
+                    self._reconnect_attempts,
+                )
+                if self.status_callback:
+                    await self.status_callback("error")
+                return
+
+            # Decorrelated jitter: grows toward the cap but stays randomized,
+            # so many instances recovering together don't reconnect in sync
+            self._current_backoff = min(
+                RECONNECT_BACKOFF_CAP,
+                random.uniform(RECONNECT_BACKOFF_BASE, self._current_backoff * 3),
             )
-            await asyncio.sleep(RECONNECT_DELAY)
+            _LOGGER.debug(
+                "Attempting to reconnect to NAD AVR in %.1f seconds",
+                self._current_backoff,
+            )
+            await asyncio.sleep(self._current_backoff)
 
             if self._should_reconnect:
+                self._reconnect_attempts += 1
                 await self.connect()
 
+    def invalidate_cache(self) -> None:
+        """Force the next device-info and source polls to hit the device."""
+        self.model = None
+        self.firmware_version = None
+        self._source_names_polled_at = 0.0
+        self._query_cache.clear()
+
     async def poll_device_info(self) -> None:
-        """Poll device information (model and firmware version)."""
-        # Poll model number
-        response = await self.query("Main.Model?\r\n", timeout=2.0)
-        if response and "=" in response:
-            try:
-                # Response format: Main.Model=MODEL_NAME
-                model = response.split("=", 1)[1].strip()
-                if model:
-                    self.model = model
-                    _LOGGER.debug("Model: %s", model)
-            except (ValueError, IndexError):
-                _LOGGER.debug("Could not parse model from: %s", response)
-
-        # Small delay to ensure responses don't overlap
-        await asyncio.sleep(0.1)
-
-        # Poll firmware version
-        response = await self.query("Main.Version?\r\n", timeout=2.0)
-        if response and "=" in response:
-            try:
-                # Response format: Main.Version=X.X.X
-                version = response.split("=", 1)[1].strip()
-                if version:
-                    self.firmware_version = version
-                    _LOGGER.debug("Firmware version: %s", version)
-            except (ValueError, IndexError):
-                _LOGGER.debug("Could not parse firmware version from: %s", response)
-
-    async def poll_source_names(self, source_count: int = 9) -> dict[str, str]:
-        """Poll source names and enabled status from the device."""
-        source_names = {}
-        source_enabled = {}
-
-        for source_num in range(1, source_count + 1):
-            source_id = str(source_num)
-
-            # Check if source is enabled
-            enabled_query = f"Source{source_num}.Enabled?\r\n"
-            enabled_response = await self.query(enabled_query, timeout=1.5)
-
-            is_enabled = False
-            if enabled_response and "=" in enabled_response:
-                try:
-                    # Response format: Source1.Enabled=Yes or No
-                    enabled_value = enabled_response.split("=", 1)[1].strip().lower()
-                    is_enabled = enabled_value in ["yes", "on", "true", "1"]
-                    source_enabled[source_id] = is_enabled
-                except (ValueError, IndexError):
-                    _LOGGER.debug(
-                        "Could not parse source enabled from: %s", enabled_response
-                    )
-
-            # Only query name if source is enabled
-            if is_enabled:
-                name_query = f"Source{source_num}.Name?\r\n"
-                name_response = await self.query(name_query, timeout=1.5)
-
-                if name_response and "=" in name_response:
-                    try:
-                        # Response format: Source1.Name=Name
-                        name = name_response.split("=", 1)[1].strip()
-                        if name:
-                            source_names[source_id] = name
-                    except (ValueError, IndexError):
-                        _LOGGER.debug(
-                            "Could not parse source name from: %s", name_response
-                        )
-
-        self.source_names = source_names
-        self.source_enabled = source_enabled
-        _LOGGER.debug(
-            "Polled %d sources: %d enabled with names",
-            source_count,
-            len(source_names),
+        """Poll device information (model and firmware version).
+
+        Concurrent callers share one in-flight poll instead of issuing
+        duplicate queries.
+        """
+        # Model and firmware never change at runtime; skip redundant
+        # round-trips on reconnect
+        if self.model and self.firmware_version:
+            return
+
+        if self._inflight_device_info is None or self._inflight_device_info.done():
+            self._inflight_device_info = asyncio.create_task(
+                self._do_poll_device_info()
+            )
+        await self._inflight_device_info
+
+    async def _do_poll_device_info(self) -> None:
+        """Query the model and firmware version from the device."""
+        # The two queries are independent and the reader routes each reply
+        # by key, so issue both at once instead of paying two round-trips
+        model_response, version_response = await asyncio.gather(
+            self.query("Main.Model?\r\n", timeout=2.0),
+            self.query("Main.Version?\r\n", timeout=2.0),
         )
-        return source_names
 
-    async def send_command(self, command: str) -> bool:
-        """Send a command to the NAD AVR."""
-        async with self._lock:
-            if not self._connected or not self._writer:
-                _LOGGER.warning("Cannot send command, not connected")
-                return False
+        if model_response:
+            # Response format: Main.Model=MODEL_NAME; partition never raises
+            # on a missing separator, it just yields an empty value
+            model = model_response.partition("=")[2].strip()
+            if model:
+                self.model = model
+                _LOGGER.debug("Model: %s", model)
+
+        if version_response:
+            # Response format: Main.Version=X.X.X
+            version = version_response.partition("=")[2].strip()
+            if version:
+                self.firmware_version = version
+                _LOGGER.debug("Firmware version: %s", version)
+
+    async def poll_source_names(self, source_count: int = 9) -> list[SourceInfo]:
+        """Poll source names and enabled status from the device.
+
+        The enabled? and name? queries are pipelined in two batched writes,
+        so the whole poll costs two round-trips instead of one per query.
+        Cached results are returned for an hour so flaky networks don't pay
+        the full poll on every reconnect; call invalidate_cache() to force
+        a refresh. Concurrent callers share one in-flight poll.
+        """
+        if (
+            self.sources
+            and time.monotonic() - self._source_names_polled_at < SOURCE_CACHE_TTL
+        ):
+            return self.sources
+
+        if self._inflight_source_names is None or self._inflight_source_names.done():
+            self._inflight_source_names = asyncio.create_task(
+                self._do_poll_source_names(source_count)
+            )
+        return await self._inflight_source_names
+
+    async def _do_poll_source_names(self, source_count: int) -> list[SourceInfo]:
+        """Query enabled flags and names for every source from the device."""
+        sources = [SourceInfo(str(n)) for n in range(1, source_count + 1)]
 
+        # First batch: enabled status for every source in one write
+        enabled_responses = await self.query_many(
+            SOURCE_ENABLED_CMDS[:source_count], timeout=3.0
+        )
+        if not enabled_responses:
+            # Nothing answered the batch. A firmware that simply lacks the
+            # SourceN queries should degrade to the default source list,
+            # so only treat this as a dead link if the main zone is silent
+            # too - then kick reconnect instead of timing out the name batch
+            if await self.query(b"Main.Power?\r\n", timeout=2.0) is None:
+                _LOGGER.warning("NAD AVR stopped responding during source poll")
+                await self._handle_disconnect()
+                raise ConnectionError(
+                    "NAD AVR stopped responding during source poll"
+                )
+            _LOGGER.debug("No response to source queries; using default sources")
+
+        for source in sources:
+            response = enabled_responses.get(f"Source{source.id}.Enabled")
+            if response:
+                # Response format: Source1.Enabled=Yes or No
+                source.enabled = _ENABLED_RE.search(response) is not None
+
+        enabled = [source for source in sources if source.enabled]
+
+        # Second batch: names, only for the enabled sources
+        if enabled:
+            name_responses = await self.query_many(
+                [SOURCE_NAME_CMDS[int(source.id) - 1] for source in enabled],
+                timeout=3.0,
+            )
+            for source in enabled:
+                response = name_responses.get(f"Source{source.id}.Name")
+                if response:
+                    # Response format: Source1.Name=Name
+                    name = response.partition("=")[2].strip()
+                    if name:
+                        source.name = name
+
+        self.sources = sources
+        self.source_name_to_id = {s.name: s.id for s in sources if s.name}
+        self._refresh_enabled_sources()
+        self._source_names_polled_at = time.monotonic()
+        _LOGGER.debug(
+            "Polled %d sources: %d enabled",
+            source_count,
+            len(self.enabled_sources),
+        )
+        return sources
+
+    async def _drain_if_needed(self):
+        """Drain the writer only when buffered data builds up.
+
+        For sub-kB frames that fit straight into the socket buffer,
+        drain() is an event-loop turn with no flow-control benefit; it
+        only runs once DRAIN_THRESHOLD bytes are actually queued.
+        """
+        if self._writer.transport.get_write_buffer_size() > DRAIN_THRESHOLD:
+            await self._writer.drain()
+
+    async def _tx_loop(self):
+        """Write queued command frames, coalescing bursts into one drain."""
+        while True:
+            frame = await self._tx_queue.get()
+            if not self._writer:
+                continue
+            # Collect the whole burst first so the transport gets one
+            # scatter-gather writelines() - and ideally one send() - instead
+            # of a write call per frame
+            frames = [frame]
+            while not self._tx_queue.empty():
+                frames.append(self._tx_queue.get_nowait())
             try:
-                _LOGGER.debug("Sending command to NAD: %s", command.strip())
-                self._writer.write(command.encode("utf-8"))
-                await self._writer.drain()
-                return True
+                if len(frames) == 1:
+                    self._writer.write(frame)
+                else:
+                    self._writer.writelines(frames)
+                await self._drain_if_needed()
             except (OSError, ConnectionResetError) as err:
-                _LOGGER.error("Error sending command: %s", err)
+                _LOGGER.error("Error writing to NAD AVR: %s", err)
                 await self._handle_disconnect()
-                return False
 
-    async def query(self, command: str, timeout: float = 2.0) -> str | None:
-        """Send a query command and wait for response."""
-        async with self._lock:
-            if not self._connected or not self._writer or not self._reader:
-                _LOGGER.warning("Cannot query, not connected")
-                return None
+    async def send_command(self, command: str | bytes) -> bool:
+        """Queue a command for the writer task to send."""
+        if isinstance(command, str):
+            command = command.encode("utf-8")
 
-            # Cancel any existing pending query
-            if self._pending_query and not self._pending_query.done():
-                self._pending_query.cancel()
+        if not self._connected or not self._writer:
+            _LOGGER.warning("Cannot send command, not connected")
+            return False
 
-            try:
-                _LOGGER.debug("Querying NAD: %s", command.strip())
+        _LOGGER.debug("Sending command to NAD: %s", command)
+        self._tx_queue.put_nowait(command)
+        return True
 
-                # Create a future to wait for the response
-                self._pending_query = asyncio.get_event_loop().create_future()
+    async def send_commands(self, commands: list[str | bytes]) -> bool:
+        """Queue several commands; the writer flushes them as one batch.
 
-                # Send the command
-                self._writer.write(command.encode("utf-8"))
-                await self._writer.drain()
+        The tx loop collects everything queued before its next drain into
+        a single writelines() call, so a macro of commands goes out in one
+        send() instead of one write+drain per command.
+        """
+        if not self._connected or not self._writer:
+            _LOGGER.warning("Cannot send commands, not connected")
+            return False
 
-                # Wait for the background reader to populate the future
-                response = await asyncio.wait_for(self._pending_query, timeout=timeout)
+        for command in commands:
+            if isinstance(command, str):
+                command = command.encode("utf-8")
+            _LOGGER.debug("Sending command to NAD: %s", command)
+            self._tx_queue.put_nowait(command)
+        return True
+
+    async def query_many(
+        self, commands: list[str | bytes], timeout: float = 2.0
+    ) -> dict[str, str]:
+        """Send multiple query commands in one write and collect the responses.
+
+        Returns a dict mapping the response key prefix (e.g. "Main.Power")
+        to the full response line. Queries that received no response within
+        the timeout are omitted from the result.
+        """
+        if not self._connected or not self._writer or not self._reader:
+            _LOGGER.warning("Cannot query, not connected")
+            return {}
+
+        futures: dict[bytes, asyncio.Future] = {}
+        payload = bytearray()
+        for command in commands:
+            if isinstance(command, str):
+                command = command.encode("utf-8")
+            key = command.split(b"?", 1)[0].split(b"=", 1)[0].strip()
+            future = self._loop.create_future()
+            futures[key] = future
+            self._pending[key].append(future)
+            payload += command
 
-                _LOGGER.debug("Query response: %s", response)
-                return response
+        try:
+            _LOGGER.debug("Sending batched queries: %s", len(commands))
+            # Single write for all queries - one round-trip instead of N.
+            # The whole payload goes out in one write() call, which the
+            # event loop never interleaves, so no lock is needed
+            self._writer.write(bytes(payload))
+            await self._drain_if_needed()
+
+            # Wait for the background reader to resolve the futures
+            await asyncio.wait(futures.values(), timeout=timeout)
+        except (OSError, ConnectionResetError) as err:
+            _LOGGER.error("Error during batched query: %s", err)
+            await self._handle_disconnect()
+            return {}
+        finally:
+            for key, future in futures.items():
+                self._discard_waiter(key, future)
+
+        results: dict[str, str] = {}
+        for key, future in futures.items():
+            if future.done() and not future.cancelled():
+                results[key.decode()] = future.result()
+            else:
+                future.cancel()
+                _LOGGER.debug("No response to batched query: %s", key)
+        return results
+
+    async def query(self, command: str | bytes, timeout: float = 2.0) -> str | None:
+        """Send a query command and wait for response."""
+        if isinstance(command, str):
+            command = command.encode("utf-8")
+
+        if not self._connected or not self._writer or not self._reader:
+            _LOGGER.warning("Cannot query, not connected")
+            return None
+
+        # Register a future under the expected response key so the reader
+        # can route the reply; concurrent queries - even for the same key -
+        # can overlap on the wire instead of serializing on a single slot
+        key = command.split(b"?", 1)[0].split(b"=", 1)[0].strip()
+
+        # Immutable and rarely-changing values are served from cache;
+        # unsolicited updates for the same key invalidate entries
+        ttl = _cache_ttl_for(key)
+        if ttl is not None:
+            cached = self._query_cache.get(key)
+            if cached and time.monotonic() - cached[0] < ttl:
+                _LOGGER.debug("Query served from cache: %s", command)
+                return cached[1]
 
-            except TimeoutError:
-                _LOGGER.warning("Query timeout: %s", command.strip())
-                if self._pending_query and not self._pending_query.done():
-                    self._pending_query.cancel()
-                self._pending_query = None
-                return None
-            except asyncio.CancelledError:
-                _LOGGER.debug("Query cancelled: %s", command.strip())
-                self._pending_query = None
-                return None
-            except (OSError, ConnectionResetError) as err:
-                _LOGGER.error("Error during query: %s", err)
-                if self._pending_query and not self._pending_query.done():
-                    self._pending_query.cancel()
-                self._pending_query = None
-                await self._handle_disconnect()
-                return None
+        try:
+            _LOGGER.debug("Querying NAD: %s", command)
+
+            async with self._await_response(key) as future:
+                # A command is a single write() call, which the event loop
+                # never interleaves with other writers, so no lock is needed
+                self._writer.write(command)
+                await self._drain_if_needed()
+
+                # Wait for the background reader to populate the future;
+                # asyncio.timeout avoids wait_for's per-call wrapper task
+                async with asyncio.timeout(timeout):
+                    response = await future
+
+            if ttl is not None:
+                self._query_cache[key] = (time.monotonic(), response)
+            _LOGGER.debug("Query response: %s", response)
+            return response
+
+        except TimeoutError:
+            _LOGGER.warning("Query timeout: %s", command)
+            return None
+        except asyncio.CancelledError:
+            _LOGGER.debug("Query cancelled: %s", command)
+            return None
+        except (OSError, ConnectionResetError) as err:
+            _LOGGER.error("Error during query: %s", err)
+            await self._handle_disconnect()
+            return None